@@ -1,66 +1,145 @@
 #!/usr/bin/env python3
 
-import json
+import mmap
 import os
+import stat
 import sys
-from datetime import datetime
+from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 
+# Most buffers a single os.writev call accepts (POSIX minimum is 16)
+try:
+    _IOV_MAX = max(os.sysconf("SC_IOV_MAX"), 16)
+except (AttributeError, ValueError, OSError):
+    _IOV_MAX = 1024
+
+@lru_cache(maxsize=None)
+def _ensure_dir(path):
+    """Create a directory once per process and return it as a Path."""
+    directory = Path(path)
+    directory.mkdir(exist_ok=True)
+    return directory
+
+def _lines_with(data, needle):
+    """Return the lines of data containing needle, without line endings."""
+    lines = []
+    pos = data.find(needle)
+    while pos >= 0:
+        # Both \n and \r end a line; the \r search stays within the \n-delimited line
+        start = data.rfind(b"\n", 0, pos) + 1
+        cr = data.rfind(b"\r", start, pos)
+        if cr >= 0:
+            start = cr + 1
+        end = data.find(b"\n", pos)
+        if end < 0:
+            end = len(data)
+        cr = data.find(b"\r", pos, end)
+        if cr >= 0:
+            end = cr
+        lines.append(data[start:end])
+        pos = data.find(needle, end)
+    return lines
+
 class ReportGenerator:
     def __init__(self):
-        self.report_dir = Path("reports")
-        self.report_dir.mkdir(exist_ok=True)
+        self.report_dir = _ensure_dir("reports")
         self.report_path = self.report_dir / "analysis-report.md"
         
     def generate_report(self):
         """Generate the analysis report."""
+        timestamp = datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S UTC')
         report_content = []
         
         # Add header
         report_content.extend([
-            "# Code Analysis Report",
-            f"Generated on: {datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S UTC')}",
-            "",
-            "## Summary",
-            "",
+            b"# Code Analysis Report",
+            f"Generated on: {timestamp}".encode(),
+            b"",
+            b"## Summary",
+            b"",
         ])
         
         # Add clippy results
         clippy_results = self.process_clippy_output()
         if clippy_results:
             report_content.extend([
-                "### Rust Analysis",
-                "",
-                "#### Clippy Findings",
-                "",
+                b"### Rust Analysis",
+                b"",
+                b"#### Clippy Findings",
+                b"",
                 *clippy_results,
-                "",
+                b"",
             ])
         
         # Add formatting check results
         fmt_results = self.process_fmt_output()
         if fmt_results:
             report_content.extend([
-                "#### Formatting Issues",
-                "",
+                b"#### Formatting Issues",
+                b"",
                 *fmt_results,
-                "",
+                b"",
             ])
         
         # Add test results
         test_results = self.process_test_output()
         if test_results:
             report_content.extend([
-                "### Test Results",
-                "",
+                b"### Test Results",
+                b"",
                 *test_results,
-                "",
+                b"",
             ])
         
         # Write report
-        self.report_path.write_text("\n".join(report_content))
+        self._write_report(report_content)
         print(f"Report generated at {self.report_path}")
 
+    def _write_report(self, lines):
+        """Write the report lines to disk with os.writev."""
+        iov = []
+        for line in lines:
+            if line:
+                iov.append(line)
+            iov.append(b"\n")
+        if iov:
+            iov.pop()
+
+        fd = os.open(self.report_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            if not hasattr(os, "writev"):
+                view = memoryview(b"".join(iov))
+                while view:
+                    view = view[os.write(fd, view):]
+                return
+
+            i = 0
+            while i < len(iov):
+                written = os.writev(fd, iov[i:i + _IOV_MAX])
+                # Skip the buffers written in full and trim a partially written one
+                while i < len(iov) and written >= len(iov[i]):
+                    written -= len(iov[i])
+                    i += 1
+                if written:
+                    iov[i] = iov[i][written:]
+        finally:
+            os.close(fd)
+
+    def _scan(self, path, *needles):
+        """Return, for each needle, the lines of a log containing it as raw bytes."""
+        with open(path, "rb") as f:
+            info = os.fstat(f.fileno())
+            # Pipes and other special files cannot be mapped
+            if not stat.S_ISREG(info.st_mode):
+                data = f.read()
+                return [_lines_with(data, needle) for needle in needles]
+            # Empty files cannot be mapped and have nothing to match
+            if not info.st_size:
+                return [[] for needle in needles]
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return [_lines_with(mm, needle) for needle in needles]
+
     def process_clippy_output(self):
         """Process Clippy output for the report."""
         results = []
@@ -68,23 +147,20 @@ class ReportGenerator:
             # Read Clippy output from stderr redirection
             clippy_output = Path("clippy-output.txt")
             if clippy_output.exists():
-                warnings = []
-                for line in clippy_output.read_text().splitlines():
-                    if "warning:" in line:
-                        warnings.append(line)
+                [warnings] = self._scan(clippy_output, b"warning:")
                 
                 if warnings:
                     results.extend([
-                        f"Found {len(warnings)} clippy warnings:",
-                        "",
-                        "```",
+                        f"Found {len(warnings)} clippy warnings:".encode(),
+                        b"",
+                        b"```",
                         *warnings,
-                        "```",
+                        b"```",
                     ])
                 else:
-                    results.append("No clippy warnings found.")
+                    results.append(b"No clippy warnings found.")
         except Exception as e:
-            results.append(f"Error processing clippy output: {e}")
+            results.append(f"Error processing clippy output: {e}".encode())
         
         return results
 
@@ -95,23 +171,20 @@ class ReportGenerator:
             # Read fmt output from stderr redirection
             fmt_output = Path("fmt-output.txt")
             if fmt_output.exists():
-                formatting_issues = []
-                for line in fmt_output.read_text().splitlines():
-                    if "Diff in" in line:
-                        formatting_issues.append(line)
+                [formatting_issues] = self._scan(fmt_output, b"Diff in")
                 
                 if formatting_issues:
                     results.extend([
-                        f"Found {len(formatting_issues)} formatting issues:",
-                        "",
-                        "```",
+                        f"Found {len(formatting_issues)} formatting issues:".encode(),
+                        b"",
+                        b"```",
                         *formatting_issues,
-                        "```",
+                        b"```",
                     ])
                 else:
-                    results.append("No formatting issues found.")
+                    results.append(b"No formatting issues found.")
         except Exception as e:
-            results.append(f"Error processing fmt output: {e}")
+            results.append(f"Error processing fmt output: {e}".encode())
         
         return results
 
@@ -122,25 +195,22 @@ class ReportGenerator:
             # Read test output from stderr redirection
             test_output = Path("test-output.txt")
             if test_output.exists():
-                test_content = test_output.read_text()
-                if "test result: ok" in test_content:
-                    results.append("✅ All tests passed")
-                else:
-                    failed_tests = []
-                    for line in test_content.splitlines():
-                        if "test result: FAILED" in line:
-                            failed_tests.append(line)
-                    
-                    if failed_tests:
-                        results.extend([
-                            "❌ Some tests failed:",
-                            "",
-                            "```",
-                            *failed_tests,
-                            "```",
-                        ])
+                passed, failed_tests = self._scan(
+                    test_output, b"test result: ok", b"test result: FAILED"
+                )
+                
+                if passed:
+                    results.append("✅ All tests passed".encode())
+                elif failed_tests:
+                    results.extend([
+                        "❌ Some tests failed:".encode(),
+                        b"",
+                        b"```",
+                        *failed_tests,
+                        b"```",
+                    ])
         except Exception as e:
-            results.append(f"Error processing test output: {e}")
+            results.append(f"Error processing test output: {e}".encode())
         
         return results
 